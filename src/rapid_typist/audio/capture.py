@@ -1,19 +1,29 @@
 from __future__ import annotations
 
 import threading
-from queue import Queue
-from typing import Iterator, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 import numpy as np
-import sounddevice as sd
+
+from .spsc import FrameRing
+
+if TYPE_CHECKING:  # sounddevice dlopens PortAudio; imported when a stream is opened
+    import sounddevice as sd
 
 
 class AudioCapture:
+    """16 kHz mono capture in fixed blocks.
+
+    The callback copies each block into a preallocated slot of a lock-free SPSC ring;
+    ``frames()`` yields views into those slots. A yielded frame stays valid until the
+    next one is requested, so callers that keep audio must copy it.
+    """
+
     def __init__(self, samplerate: int = 16000, block_ms: int = 30, device: Optional[str] = None) -> None:
         self.samplerate = samplerate
         self.block = int(samplerate * (block_ms / 1000.0))
         self.device = device
-        self._queue: "Queue[np.ndarray]" = Queue(maxsize=100)
+        self._ring = FrameRing(128, self.block)
         self._stream: Optional[sd.InputStream] = None
         self._running = threading.Event()
 
@@ -21,16 +31,14 @@ class AudioCapture:
         if status:
             # drop status to avoid blocking audio thread
             pass
-        pcm = (indata[:, 0] * 32768.0).astype(np.int16, copy=False) if indata.dtype != np.int16 else indata[:, 0].copy()
-        try:
-            self._queue.put_nowait(pcm)
-        except Exception:
-            # drop if backpressure
-            pass
+        # drops the block on backpressure; the stream is opened with dtype="int16"
+        self._ring.put(indata[:, 0])
 
     def start(self) -> None:
         if self._stream is not None:
             return
+        import sounddevice as sd
+
         self._running.set()
         self._stream = sd.InputStream(
             channels=1,
@@ -50,17 +58,11 @@ class AudioCapture:
                 self._stream.close()
             finally:
                 self._stream = None
-        # drain queue
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except Exception:
-                break
+        self._ring.clear()
 
     def frames(self) -> Iterator[np.ndarray]:
+        get = self._ring.get
         while self._running.is_set():
-            try:
-                yield self._queue.get(timeout=0.2)
-            except Exception:
-                continue
-
+            frame = get(0.2)
+            if frame is not None:
+                yield frame
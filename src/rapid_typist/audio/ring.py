@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+
+class RollingBuffer:
+    """Fixed-size window over the most recent samples, backed by one preallocated array.
+
+    With ``scale`` set, samples are multiplied on write, e.g. a float32 window with
+    ``scale=1/32768`` holds int16 input already converted for the engine.
+    With ``frame_samples`` set, the size is rounded up to whole frames and frame-sized
+    writes go straight into precomputed per-frame views (one ufunc call, no wrap split).
+    """
+
+    def __init__(
+        self,
+        size: int,
+        dtype=np.int16,
+        scale: Optional[float] = None,
+        frame_samples: Optional[int] = None,
+    ) -> None:
+        if frame_samples:
+            size = -(-size // frame_samples) * frame_samples
+        self._buf = np.empty(size, dtype=dtype)
+        self._scale = None if scale is None else self._buf.dtype.type(scale)
+        self._frame = frame_samples or 0
+        self._frame_views = (
+            [self._buf[i : i + frame_samples] for i in range(0, size, frame_samples)] if frame_samples else None
+        )
+        self._w = 0
+        self._filled = False
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self._buf.shape[0] if self._filled else self._w
+
+    def write(self, pcm: np.ndarray) -> None:
+        size = self._buf.shape[0]
+        n = pcm.shape[0]
+        self.total += n
+        if self._frame and n == self._frame and self._w % n == 0:
+            i = self._w // n
+            if self._scale is None:
+                self._frame_views[i][:] = pcm
+            else:
+                np.multiply(pcm, self._scale, out=self._frame_views[i])
+            i += 1
+            if i == len(self._frame_views):
+                self._w = 0
+                self._filled = True
+            else:
+                self._w = i * n
+            return
+        if n >= size:
+            self._put(0, pcm[n - size :])
+            self._w = 0
+            self._filled = True
+            return
+        w = self._w
+        end = w + n
+        if end <= size:
+            self._put(w, pcm)
+        else:
+            k = size - w
+            self._put(w, pcm[:k])
+            self._put(0, pcm[k:])
+        if end >= size:
+            self._filled = True
+        self._w = end % size
+
+    def _put(self, at: int, pcm: np.ndarray) -> None:
+        dst = self._buf[at : at + pcm.shape[0]]
+        if self._scale is None:
+            dst[:] = pcm
+        else:
+            np.multiply(pcm, self._scale, out=dst)
+
+    def snapshot(self) -> np.ndarray:
+        """Return a contiguous copy of the window, oldest sample first."""
+        return self.latest(len(self))
+
+    def latest(self, n: int) -> np.ndarray:
+        """Return a contiguous copy of the newest ``n`` samples (fewer if not yet written)."""
+        w = self._w
+        n = min(n, len(self))
+        if n <= w:
+            return self._buf[w - n : w].copy()
+        return np.concatenate((self._buf[self._buf.shape[0] - (n - w) :], self._buf[:w]))
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Copy the window, oldest sample first, into ``out`` with at most two slice copies.
+        Returns the number of samples copied.
+        """
+        w = self._w
+        if not self._filled:
+            out[:w] = self._buf[:w]
+            return w
+        size = self._buf.shape[0]
+        k = size - w
+        out[:k] = self._buf[w:]
+        out[k:size] = self._buf[:w]
+        return size
+
+    def clear(self) -> None:
+        self._w = 0
+        self._filled = False
+        self.total = 0
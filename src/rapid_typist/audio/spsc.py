@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import threading
+from typing import Iterator, Optional
+
+import numpy as np
+
+
+class FrameRing:
+    """Single-producer/single-consumer ring of fixed-size frames.
+
+    The producer copies each frame into a preallocated slot and publishes it by
+    advancing the tail; the consumer reads the slot at the head. Each cursor is
+    written by one thread only. The producer signals the wakeup Event only when the
+    consumer is parked in ``get()``, so a put into a busy ring takes no lock. A frame returned by ``get()`` is a view that
+    stays valid until the next ``get()`` (one slot is held back for it).
+    """
+
+    def __init__(self, slots: int, frame_samples: int, dtype=np.int16) -> None:
+        assert slots >= 2
+        self._buf = np.empty((slots, frame_samples), dtype=dtype)
+        # Slot views are created once and handed out repeatedly: no new ndarray per frame
+        self._views = [self._buf[i] for i in range(slots)]
+        self._slots = slots
+        self._head = 0
+        self._tail = 0
+        self._ready = threading.Event()
+        self._waiting = False
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def put(self, pcm: np.ndarray) -> bool:
+        """Copy a frame into the ring; returns False (frame dropped) when full."""
+        tail = self._tail
+        if tail - self._head >= self._slots - 1:
+            return False
+        # the copy must stay: PortAudio reuses its input buffer after the callback returns
+        np.copyto(self._views[tail % self._slots], pcm)
+        self._tail = tail + 1
+        # read after publishing the tail: a consumer that parked before this sees the set,
+        # one that parks after it sees the new tail on its re-check
+        if self._waiting:
+            self._ready.set()
+        return True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Return the oldest frame, or None if nothing arrives within timeout."""
+        if self._head == self._tail:
+            self._ready.clear()
+            self._waiting = True
+            try:
+                if self._head == self._tail:
+                    self._ready.wait(timeout)
+            finally:
+                self._waiting = False
+            if self._head == self._tail:
+                return None
+        head = self._head
+        frame = self._views[head % self._slots]
+        self._head = head + 1
+        return frame
+
+    def frames(self, stop_evt: threading.Event, timeout: float = 0.2) -> Iterator[np.ndarray]:
+        """Yield frames until ``stop_evt`` is set, waking at least every ``timeout`` seconds."""
+        get = self.get
+        while not stop_evt.is_set():
+            frame = get(timeout)
+            if frame is not None:
+                yield frame
+
+    def clear(self) -> None:
+        """Discard pending frames (consumer side)."""
+        self._head = self._tail
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import math
+from typing import Optional
+
 import numpy as np
 
+# int16 full scale as a float32 scalar, so int16 * INT16_SCALE stays float32
+INT16_SCALE = np.float32(1.0 / 32768.0)
+_INV_FULL_SCALE_SQ = 1.0 / (32768.0 * 32768.0)
+_POWER_FLOOR = 1e-12  # -120 dBFS
+
 
-def int16_to_float32(pcm: np.ndarray) -> np.ndarray:
+def int16_to_float32(pcm: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Scale int16 PCM to float32 in [-1, 1) in one pass, into ``out`` when given."""
     if pcm.dtype != np.int16:
         pcm = pcm.astype(np.int16, copy=False)
-    return (pcm.astype(np.float32) / 32768.0).clip(-1.0, 1.0)
+    # int16 / 32768 never leaves [-1, 1), so no clip pass is needed
+    return np.multiply(pcm, INT16_SCALE, out=out, dtype=np.float32, casting="unsafe")
 
 
 def rms_dbfs(pcm: np.ndarray) -> float:
     if pcm.size == 0:
         return -120.0
-    x = pcm.astype(np.float32) / 32768.0
-    rms = np.sqrt(np.mean(x * x) + 1e-12)
-    db = 20.0 * np.log10(rms + 1e-12)
-    return float(db)
-
+    # Exact integer sum of squares; the only float work is on the final scalar
+    acc = pcm.astype(np.int64, copy=False)
+    ms = int(np.dot(acc, acc)) * _INV_FULL_SCALE_SQ / pcm.size
+    # 20*log10(sqrt(ms)) == 10*log10(ms): stay in the power domain
+    return 10.0 * math.log10(ms + _POWER_FLOOR)
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from collections import deque
-from typing import Deque, Iterator, Tuple
+from typing import Iterator, Optional, Tuple
 
 import numpy as np
 import webrtcvad
 
+from .ring import RollingBuffer
+from .utils import INT16_SCALE, rms_dbfs
+
+try:  # C entry point behind webrtcvad.Vad.is_speech; lets the hot loop skip the Python wrapper
+    from _webrtcvad import process as _vad_process  # type: ignore
+except Exception:  # pragma: no cover
+    _vad_process = None
+
 
 class Segmenter:
     def __init__(
@@ -15,91 +22,129 @@ class Segmenter:
         hangover_ms: int = 300,
         preroll_ms: int = 150,
         samplerate: int = 16000,
+        max_segment_ms: int = 30000,
+        level_every: int = 1,
+        float_segments: bool = False,
     ) -> None:
+        """With ``float_segments``, finalized segments are float32 in [-1, 1): the copy out of
+        the segment buffer doubles as the int16 -> float32 conversion the engine needs.
+        """
         assert frame_ms in (10, 20, 30)
         self.vad = webrtcvad.Vad(aggressiveness)
         self.frame_ms = frame_ms
         self.hangover_frames = max(1, hangover_ms // frame_ms)
         self.preroll_frames = max(0, preroll_ms // frame_ms)
         self.samplerate = samplerate
+        self.level_every = max(1, level_every)
+        self.frame_samples = samplerate * frame_ms // 1000
+        if not webrtcvad.valid_rate_and_frame_length(samplerate, self.frame_samples):
+            raise ValueError(f"webrtcvad cannot process {frame_ms} ms frames at {samplerate} Hz")
+        # Preallocated buffers: a flat preroll ring of samples and a linear segment buffer
+        max_frames = max(self.preroll_frames + 1, max_segment_ms // frame_ms)
+        self._pre = RollingBuffer(
+            max(1, self.preroll_frames) * self.frame_samples, frame_samples=self.frame_samples
+        )
+        self._seg_buf = np.empty(max_frames * self.frame_samples, dtype=np.int16)
+        self._seg_len = 0
+        self._seg_scale = INT16_SCALE if float_segments else None
+
+    def _push_preroll(self, pcm: np.ndarray) -> None:
+        if self.preroll_frames:
+            self._pre.write(pcm)
+
+    def _start_segment(self) -> None:
+        self._seg_len = self._pre.read_into(self._seg_buf)
 
-    def _frame_bytes(self, pcm: np.ndarray) -> bytes:
-        return pcm.tobytes()
+    def _append(self, pcm: np.ndarray) -> Optional[np.ndarray]:
+        """Copy a frame into the segment buffer; returns a finalized segment if the buffer was full."""
+        out = None
+        n = pcm.shape[0]
+        if self._seg_len + n > self._seg_buf.shape[0]:
+            out = self._finish()
+        self._seg_buf[self._seg_len : self._seg_len + n] = pcm
+        self._seg_len += n
+        return out
+
+    def _finish(self) -> Optional[np.ndarray]:
+        seg = None
+        if self._seg_len:
+            view = self._seg_buf[: self._seg_len]
+            seg = view.copy() if self._seg_scale is None else np.multiply(view, self._seg_scale)
+        self._seg_len = 0
+        return seg
+
+    def _check_frame(self, pcm: np.ndarray) -> None:
+        if pcm.dtype != np.int16 or pcm.shape != (self.frame_samples,):
+            raise ValueError(
+                f"expected int16 frames of {self.frame_samples} samples, got {pcm.dtype} {pcm.shape}"
+            )
 
     def run(self, frames: Iterator[np.ndarray]) -> Iterator[Tuple[np.ndarray, bool, float]]:
         """Yield (frame, is_speech, level_dbfs) for each 30ms frame.
         Also internally detects segments and yields final segments through a side-channel? Not here.
         This generator is used by the higher-level pipeline to build segments.
+        The level is recomputed every ``level_every`` frames and repeated in between.
+        Frames go to webrtcvad at the capture rate: its 16 kHz path already decimates to
+        8 kHz in C, so downsampling here would only add a pass.
         """
-        from .utils import rms_dbfs
-
+        # Hot loop: bind per-frame lookups to locals once
+        vad_is_speech = self.vad.is_speech
+        handle = getattr(self.vad, "_vad", None) if _vad_process is not None else None
+        process = _vad_process
+        samplerate = self.samplerate
+        level_every = self.level_every
+        u8 = np.uint8
+        level = -120.0
+        n = 0
         for pcm in frames:
-            is_speech = False
-            try:
-                is_speech = self.vad.is_speech(self._frame_bytes(pcm), self.samplerate)
-            except Exception:
-                is_speech = False
-            level = rms_dbfs(pcm)
+            if n == 0:
+                self._check_frame(pcm)
+            # webrtcvad accepts any bytes-like object; a uint8 view avoids a tobytes() copy
+            if handle is not None:
+                is_speech = process(handle, samplerate, pcm.view(u8), pcm.shape[0])
+            else:
+                is_speech = vad_is_speech(pcm.view(u8), samplerate)
+            if n % level_every == 0:
+                level = rms_dbfs(pcm)
+            n += 1
             yield pcm, is_speech, level
 
     def segments(self, frames: Iterator[np.ndarray]) -> Iterator[np.ndarray]:
         """Build segments from frames using VAD with hangover and preroll."""
-        active: bool = False
-        hang: int = 0
-        pre: Deque[np.ndarray] = deque(maxlen=self.preroll_frames)
-        cur: Deque[np.ndarray] = deque()
-        for pcm, speech, _ in self.run(frames):
-            if speech:
-                hang = self.hangover_frames
-                if not active:
-                    active = True
-                    # start segment with preroll
-                    cur.extend(list(pre))
-                cur.append(pcm)
-            else:
-                if active:
-                    if hang > 0:
-                        hang -= 1
-                        cur.append(pcm)
-                    else:
-                        # finalize
-                        seg = np.concatenate(list(cur)) if len(cur) else np.zeros(0, dtype=np.int16)
-                        if seg.size:
-                            yield seg
-                        cur.clear()
-                        active = False
-                        pre.clear()
-                else:
-                    pre.append(pcm)
+        for seg, _, _ in self.monitor(frames):
+            if seg is not None:
+                yield seg
 
     def monitor(self, frames: Iterator[np.ndarray]):
         """Yield tuples (segment or None, vad_active: bool, level_dbfs: float).
         Allows UI to update on every frame while emitting segments when finalized.
+        Segments longer than max_segment_ms are split and emitted as they fill the buffer.
         """
         active: bool = False
         hang: int = 0
-        pre: Deque[np.ndarray] = deque(maxlen=self.preroll_frames)
-        cur: Deque[np.ndarray] = deque()
+        hangover = self.hangover_frames
+        append = self._append
+        push_preroll = self._push_preroll
+        self._pre.clear()
+        self._seg_len = 0
         for pcm, speech, level in self.run(frames):
             seg_out = None
             if speech:
-                hang = self.hangover_frames
+                hang = hangover
                 if not active:
                     active = True
-                    cur.extend(list(pre))
-                cur.append(pcm)
-            else:
-                if active:
-                    if hang > 0:
-                        hang -= 1
-                        cur.append(pcm)
-                    else:
-                        seg = np.concatenate(list(cur)) if len(cur) else np.zeros(0, dtype=np.int16)
-                        if seg.size:
-                            seg_out = seg
-                        cur.clear()
-                        active = False
-                        pre.clear()
+                    # start segment with preroll
+                    self._start_segment()
+                seg_out = append(pcm)
+            elif active:
+                if hang > 0:
+                    hang -= 1
+                    seg_out = append(pcm)
                 else:
-                    pre.append(pcm)
+                    # finalize
+                    seg_out = self._finish()
+                    active = False
+                    self._pre.clear()
+            else:
+                push_preroll(pcm)
             yield seg_out, active, level
@@ -1,21 +1,23 @@
 from __future__ import annotations
 
+import itertools
 import signal
 import sys
 import threading
 import time
 from dataclasses import dataclass
-from queue import Queue
+from queue import Empty, PriorityQueue
 from typing import Optional
 
 import click
 import numpy as np
-import sounddevice as sd
-from pynput import keyboard
 
 from .config import Config, load_config
 from .tui import TUI
 from .audio.capture import AudioCapture
+from .audio.ring import RollingBuffer
+from .audio.spsc import FrameRing
+from .audio.utils import INT16_SCALE
 from .audio.vad import Segmenter
 from .engines.whispercpp_backend import WhisperCppTranscriber
 from .sinks.base import Sink
@@ -23,9 +25,106 @@ from .sinks.stdout import StdoutSink
 from .sinks.clipboard import ClipboardSink
 from .sinks.paste import PasteSink
 from .sinks.file import FileSink
-from .audio.utils import rms_dbfs
 from .hotkey import create_hotkey_listener
-from collections import deque
+
+
+# Inference job priorities: finals always run before partials
+_FINAL = 0
+_PARTIAL = 1
+
+
+class InferenceJobs:
+    """Inference work queue shared by the segmenter and inference threads.
+
+    Finals run before partials, in arrival order; finals already waiting are handed out
+    together as one buffer. Queued partials coalesce to the newest. Each partial carries
+    the utterance epoch it was taken in; queuing a final starts a new epoch, which makes
+    older partials stale.
+    """
+
+    def __init__(self) -> None:
+        self._q: "PriorityQueue[tuple]" = PriorityQueue()
+        self._seq = itertools.count()
+        self.epoch = 0
+
+    def put_final(self, seg: np.ndarray) -> None:
+        # partials queued before this point belong to the finished utterance
+        self.epoch += 1
+        self._q.put_nowait((_FINAL, next(self._seq), seg))
+
+    def put_partial(self, payload) -> None:
+        self._q.put_nowait((_PARTIAL, next(self._seq), (self.epoch, payload)))
+
+    def is_stale(self, epoch: int) -> bool:
+        return epoch != self.epoch
+
+    def get(self, timeout: Optional[float] = None) -> tuple:
+        """Return ``(_FINAL, audio)`` or ``(_PARTIAL, (epoch, payload))``; raises Empty.
+
+        ``timeout=0`` does not block.
+        """
+        job = self._q.get(block=timeout != 0, timeout=timeout or None)
+        if job[0] == _FINAL:
+            return _FINAL, self._drain_finals(job[2])
+        # coalesce: only the newest queued partial is worth decoding
+        while True:
+            try:
+                nxt = self._q.get_nowait()
+            except Empty:
+                return _PARTIAL, job[2]
+            if nxt[0] != _PARTIAL:
+                # a final arrived meanwhile; it goes first, the partial waits behind it
+                self._q.put_nowait(job)
+                return _FINAL, self._drain_finals(nxt[2])
+            job = nxt
+
+    def _drain_finals(self, seg: np.ndarray) -> np.ndarray:
+        # finals that piled up behind a slow decode are transcribed in one whisper.cpp call
+        segs = [seg]
+        while True:
+            try:
+                nxt = self._q.get_nowait()
+            except Empty:
+                break
+            if nxt[0] != _FINAL:
+                self._q.put_nowait(nxt)
+                break
+            segs.append(nxt[2])
+        return segs[0] if len(segs) == 1 else np.concatenate(segs)
+
+
+def _partial_window(
+    ring: RollingBuffer, prev: str, last_end: int, lookbehind: int, incremental: bool
+) -> tuple[np.ndarray, Optional[str]]:
+    """Audio for the next partial and the prompt it continues (None for a full-window decode).
+
+    Incremental decodes cover the samples since the previous partial ended at ``last_end``
+    plus ``lookbehind``; when that span is no longer in the ring, the whole window is used.
+    """
+    total = ring.total
+    need = total - last_end + lookbehind
+    if incremental and prev and last_end <= total and need <= len(ring):
+        return ring.latest(need), prev
+    return ring.snapshot(), None
+
+
+def _norm_word(word: str) -> str:
+    return word.strip(".,!?;:\"'…-").lower()
+
+
+def _merge_partial(prompt: str, text: str, max_overlap: int = 6) -> str:
+    """Append an incremental decode to the text so far, dropping what the lookbehind re-decoded."""
+    head, tail = prompt.split(), text.split()
+    if not head or not tail:
+        return " ".join(head or tail)
+    for k in range(min(max_overlap, len(head), len(tail)), 0, -1):
+        if [_norm_word(w) for w in head[-k:]] == [_norm_word(w) for w in tail[:k]]:
+            return " ".join(head + tail[k:])
+    # a word cut at the previous boundary comes back whole: keep only the complete form
+    last, first = _norm_word(head[-1]), _norm_word(tail[0])
+    if last and first != last and first.startswith(last):
+        head = head[:-1]
+    return " ".join(head + tail)
 
 
 SINKS = {
@@ -36,6 +135,13 @@ SINKS = {
 }
 
 
+def build_sink(cfg: Config) -> Sink:
+    name = cfg.output.sink
+    if name == "file":
+        return FileSink(cfg.output.file_dir, separator=cfg.output.separator)
+    return SINKS[name]()  # type: ignore
+
+
 @dataclass
 class Pipeline:
     cfg: Config
@@ -47,134 +153,184 @@ class Pipeline:
         self._active = False
         self._stop_evt = threading.Event()
         self._threads: list[threading.Thread] = []
-        self._segments: "Queue[np.ndarray]" = Queue(maxsize=8)
+        # partial payloads are (audio, prompt, ring_total)
+        self._jobs = InferenceJobs()
         self._level_db: float = -120.0
         self._vad_active: bool = False
+        # live components, kept so settings can be swapped without a restart
+        self.sink: Optional[Sink] = None
+        self.segmenter: Optional[Segmenter] = None
+        # loaded model, reused across start()/stop(); reloaded only when engine config changes
+        self._engine: Optional[WhisperCppTranscriber] = None
+        self._engine_key: Optional[tuple] = None
+        self._engine_lock = threading.Lock()
+        # held while a final is delivered so set_sink() never closes a sink mid-write
+        self._sink_lock = threading.Lock()
+
+    def preload(self) -> WhisperCppTranscriber:
+        e = self.cfg.engine
+        key = (e.model, e.language, e.quant, e.coreml)
+        with self._engine_lock:
+            if self._engine is None or self._engine_key != key:
+                # Engine selection: whispercpp only (Python 3.11 target)
+                self._engine = WhisperCppTranscriber(
+                    model_name=e.model, language=e.language, quant=e.quant, coreml=e.coreml
+                )
+                self._engine_key = key
+                print("[rapid-typist] Engine: whisper.cpp")
+            return self._engine
 
     def start(self):
         if self._active:
             return
-        self._stop_evt.clear()
+        # per-session stop event and job queue: threads of a previous session never see this one's
+        stop_evt = self._stop_evt = threading.Event()
+        jobs = self._jobs = InferenceJobs()
+        segmenter_done = threading.Event()
         self._active = True
         self.tui.update(recording=True)
         print("[rapid-typist] Pipeline: start")
 
-        # Build components
-        capture = AudioCapture(
-            samplerate=16000,
-            block_ms=self.cfg.vad.frame_ms,
-            device=None if self.device_name in (None, "default") else self.device_name,
-        )
-        segmenter = Segmenter(
-            aggressiveness=self.cfg.vad.aggressiveness,
-            frame_ms=self.cfg.vad.frame_ms,
-            hangover_ms=self.cfg.vad.hangover_ms,
-            preroll_ms=self.cfg.vad.preroll_ms,
-            samplerate=16000,
-        )
-        # Engine selection: whispercpp only (Python 3.11 target)
-        engine = WhisperCppTranscriber(model_name=self.cfg.engine.model, language=self.cfg.engine.language)
-        print("[rapid-typist] Engine: whisper.cpp")
-        engine_lock = threading.Lock()
-
-        sink_name = self.cfg.output.sink
-        if sink_name == "file":
-            sink: Sink = FileSink(self.cfg.output.file_dir, separator=self.cfg.output.separator)
-        else:
-            sink = SINKS[sink_name]()  # type: ignore
+        # Build components; a failure here (bad device, model load) must not leave us marked recording
+        try:
+            capture = AudioCapture(
+                samplerate=16000,
+                block_ms=self.cfg.vad.frame_ms,
+                device=None if self.device_name in (None, "default") else self.device_name,
+            )
+            segmenter = self.segmenter = Segmenter(
+                aggressiveness=self.cfg.vad.aggressiveness,
+                frame_ms=self.cfg.vad.frame_ms,
+                hangover_ms=self.cfg.vad.hangover_ms,
+                preroll_ms=self.cfg.vad.preroll_ms,
+                samplerate=16000,
+                # level meter only needs TUI refresh rate (8/s), not every 30 ms frame
+                level_every=max(1, 125 // self.cfg.vad.frame_ms),
+                float_segments=True,
+            )
+            engine = self.preload()
+
+            self.sink = build_sink(self.cfg)
+        except Exception:
+            self._active = False
+            self.tui.update(recording=False)
+            raise
 
         # Partial streaming buffers (rolling window)
         window_sec = 5.0
         cadence_sec = 1.0
         min_sec = 1.2
-        frames_per_window = int(window_sec * (1000.0 / self.cfg.vad.frame_ms))
-        partial_ring = deque(maxlen=frames_per_window)
+        lookbehind = int(0.25 * 16000)
+        # float32 window: int16 -> float32 conversion happens once per frame, not per partial
+        partial_ring = RollingBuffer(
+            int(window_sec * 16000), dtype=np.float32, scale=INT16_SCALE, frame_samples=capture.block
+        )
 
         def runner_capture():
             capture.start()
             for pcm in capture.frames():
-                self._level_db = rms_dbfs(pcm)
-                if self._stop_evt.is_set():
+                if stop_evt.is_set():
                     break
-                try:
-                    # feed to segmenter chain
-                    frame_queue.put(pcm, timeout=0.1)
-                except Exception:
-                    pass
-                # keep partial ring
-                partial_ring.append(pcm)
+                # feed to segmenter chain; drops the frame under backpressure
+                frame_queue.put(pcm)
             capture.stop()
 
+        frames_per_partial = max(1, int(cadence_sec * 1000) // self.cfg.vad.frame_ms)
+        # (text, ring_total) of the newest partial; swapped as one tuple so readers see a consistent pair
+        last_partial = ("", 0)
+        # partial_ring is written, read and reset on the segmenter thread only; the inference
+        # thread asks for a reset after a final by bumping this counter
+        ring_resets = 0
+
+        def ring_frames():
+            nonlocal last_partial
+            seen = 0
+            for pcm in frame_queue.frames(stop_evt):
+                if self.enable_partials:
+                    if seen != ring_resets:
+                        seen = ring_resets
+                        partial_ring.clear()
+                        last_partial = ("", 0)
+                    partial_ring.write(pcm)
+                yield pcm
+
+        def submit_partial() -> bool:
+            prev, last_end = last_partial
+            # with prompt carry-over, decode only audio since the last partial (plus lookbehind)
+            audio, prompt = _partial_window(partial_ring, prev, last_end, lookbehind, engine.supports_prompt)
+            if len(audio) / 16000.0 < min_sec:
+                return False
+            jobs.put_partial((audio, prompt, partial_ring.total))
+            return True
+
         def runner_segmenter():
-            for seg, active, level in segmenter.monitor(_iter_queue(frame_queue, self._stop_evt)):
+            try:
+                segment_frames()
+            finally:
+                # no finals after this; the inference thread runs what is queued, then exits
+                segmenter_done.set()
+
+        def segment_frames():
+            nonlocal last_partial
+            since_partial = 0
+            for seg, active, level in segmenter.monitor(ring_frames()):
                 self._vad_active = active
                 self._level_db = level
                 self.tui.update(vad_active=active, level_db=level)
-                if self._stop_evt.is_set():
+                if stop_evt.is_set():
                     break
                 if seg is not None:
-                    try:
-                        self._segments.put(seg, timeout=0.1)
-                    except Exception:
-                        pass
-
-        def runner_infer():
-            while not self._stop_evt.is_set():
-                try:
-                    seg = self._segments.get(timeout=0.2)
-                except Exception:
-                    continue
-                t0 = time.time()
-                with engine_lock:
-                    text = engine.transcribe(seg)
-                latency = int((time.time() - t0) * 1000)
-                if text:
-                    sink.handle_final(text)
-                    # clear partial on final and reset rolling buffer
-                    partial_ring.clear()
-                    self.tui.update(partial_text="", last_text=text, last_latency_ms=latency)
-
-        def runner_partials():
-            last_emit = 0.0
-            while not self._stop_evt.is_set():
-                time.sleep(0.1)
+                    jobs.put_final(seg)
                 if not self.enable_partials:
                     continue
-                if not self._vad_active:
+                if not active:
+                    since_partial = 0
                     # clear lingering partial if idle
                     if self.tui.state.partial_text:
+                        last_partial = ("", 0)
                         self.tui.update(partial_text="")
                     continue
-                now = time.time()
-                if now - last_emit < cadence_sec:
-                    continue
-                # gather rolling window
-                frames = list(partial_ring)
-                if not frames:
-                    continue
-                audio = np.concatenate(frames)
-                dur = len(audio) / 16000.0
-                if dur < min_sec:
-                    continue
-                # try non-blocking lock to avoid contention with finals
-                locked = engine_lock.acquire(blocking=False)
-                if not locked:
-                    continue
+                since_partial += 1
+                if since_partial >= frames_per_partial and submit_partial():
+                    since_partial = 0
+
+        def runner_infer():
+            nonlocal last_partial, ring_resets
+            while True:
+                done = segmenter_done.is_set()
                 try:
-                    text = engine.transcribe(audio)
-                    if text:
+                    kind, payload = jobs.get(timeout=0 if done else 0.2)
+                except Empty:
+                    if done:
+                        return
+                    continue
+                if kind == _PARTIAL:
+                    epoch, (audio, prompt, total) = payload
+                    # partials are dropped once stopping; finals still run
+                    if stop_evt.is_set() or jobs.is_stale(epoch):
+                        continue
+                    text = engine.transcribe(audio, prompt=prompt)
+                    if text and not jobs.is_stale(epoch):
+                        text = _merge_partial(prompt, text) if prompt else text
+                        last_partial = (text, total)
                         self.tui.update(partial_text=text)
-                        last_emit = now
-                finally:
-                    engine_lock.release()
+                    continue
+                t0 = time.time()
+                text = engine.transcribe(payload)
+                latency = int((time.time() - t0) * 1000)
+                if text:
+                    with self._sink_lock:
+                        self.sink.handle_final(text)
+                    # clear partial on final; the segmenter thread resets the rolling buffer
+                    ring_resets += 1
+                    self.tui.update(partial_text="", last_text=text, last_latency_ms=latency)
 
-        frame_queue: "Queue[np.ndarray]" = Queue(maxsize=64)
+        frame_queue = FrameRing(64, capture.block)
 
         t1 = threading.Thread(target=runner_capture, daemon=True)
         t2 = threading.Thread(target=runner_segmenter, daemon=True)
         t3 = threading.Thread(target=runner_infer, daemon=True)
-        t4 = threading.Thread(target=runner_partials, daemon=True)
-        self._threads = [t1, t2, t3, t4]
+        self._threads = [t1, t2, t3]
         for t in self._threads:
             t.start()
 
@@ -182,13 +338,32 @@ class Pipeline:
         if not self._active:
             return
         self._stop_evt.set()
-        for t in self._threads:
-            t.join(timeout=1.5)
+        capture_t, segmenter_t, infer_t = self._threads
+        capture_t.join(timeout=1.5)
+        segmenter_t.join(timeout=1.5)
+        # finals already queued are transcribed and delivered now, not at the next start();
+        # waiting for them also keeps two sessions from sharing the engine
+        infer_t.join()
         self._threads.clear()
+        with self._sink_lock:
+            if self.sink is not None:
+                self.sink.close()
         self._active = False
         self.tui.update(recording=False)
         print("[rapid-typist] Pipeline: stop")
 
+    def set_sink(self, sink: Sink) -> None:
+        with self._sink_lock:
+            old, self.sink = self.sink, sink
+        # the infer thread only reads self.sink under the lock, so nothing writes to old past here
+        if old is not None and old is not sink:
+            old.close()
+
+    def set_vad_aggressiveness(self, aggressiveness: int) -> None:
+        self.cfg.vad.aggressiveness = int(aggressiveness)
+        if self.segmenter is not None:
+            self.segmenter.vad.set_mode(int(aggressiveness))
+
     def toggle(self):
         if self._active:
             self.stop()
@@ -196,14 +371,6 @@ class Pipeline:
             self.start()
 
 
-def _iter_queue(q: "Queue[np.ndarray]", stop_evt: threading.Event):
-    while not stop_evt.is_set():
-        try:
-            yield q.get(timeout=0.2)
-        except Exception:
-            continue
-
-
 def _map_hotkey(name: str):
     # Minimal mapping for common keys
     name = name.lower()
@@ -231,6 +398,8 @@ def devices():
 
 @devices.command("list")
 def devices_list():
+    import sounddevice as sd
+
     devs = sd.query_devices()
     default = sd.default.device
     click.echo(f"Default devices (in,out): {default}")
@@ -254,29 +423,35 @@ def bench(seconds: int, model: Optional[str], language: Optional[str], input_dev
         cfg.app.input_device = input_device
 
     sr = 16000
-    blocks = []
     cap = AudioCapture(samplerate=sr, block_ms=cfg.vad.frame_ms, device=None if cfg.app.input_device in (None, "default") else cfg.app.input_device)
     click.echo(f"Recording {seconds}s @ {sr} Hz from '{cfg.app.input_device}'...")
     cap.start()
     collected = 0
     target = seconds * sr
+    # capture frames are reused slot views; copy each into one preallocated recording
+    audio = np.empty(target + cap.block, dtype=np.int16)
     try:
         for pcm in cap.frames():
-            blocks.append(pcm)
+            audio[collected : collected + len(pcm)] = pcm
             collected += len(pcm)
             if collected >= target:
                 break
     finally:
         cap.stop()
 
-    if not blocks:
+    if not collected:
         click.echo("No audio captured. Mic permission granted?")
         return
 
-    audio = np.concatenate(blocks)
+    audio = audio[:collected]
     audio_sec = len(audio) / sr
     click.echo(f"Captured {audio_sec:.2f}s audio. Loading model '{cfg.engine.model}'...")
-    eng = WhisperCppTranscriber(model_name=cfg.engine.model, language=cfg.engine.language)
+    eng = WhisperCppTranscriber(
+        model_name=cfg.engine.model,
+        language=cfg.engine.language,
+        quant=cfg.engine.quant,
+        coreml=cfg.engine.coreml,
+    )
     click.echo("Transcribing...")
     t0 = time.time()
     text = eng.transcribe(audio)
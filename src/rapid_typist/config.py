@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 
 ConfigMode = Literal["push_to_talk", "toggle", "hands_free"]
 SinkName = Literal["stdout", "clipboard", "paste", "file"]
+QuantName = Literal["f16", "q8_0", "q5_1", "q5_0"]
 
 
 class AppConfig(BaseModel):
@@ -22,6 +23,8 @@ class EngineConfig(BaseModel):
     model: str = Field(default="base.en")
     language: str = Field(default="en")
     word_timestamps: bool = Field(default=False)
+    quant: QuantName = Field(default="f16")
+    coreml: bool = Field(default=False)
 
 
 class VadConfig(BaseModel):
@@ -55,6 +58,11 @@ backend = "whispercpp"
 model = "base.en"
 language = "en"
 word_timestamps = false
+# ggml weights: "f16" (default files) or a quantized variant "q8_0" | "q5_1" | "q5_0";
+# falls back to f16 when the quantization is not published for the model
+quant = "f16"
+# fetch the CoreML encoder (-encoder.mlmodelc) next to the model; needs a CoreML build of whisper.cpp
+coreml = false
 
 [vad]
 aggressiveness = 2
@@ -102,7 +110,9 @@ def save_config(cfg: Config) -> None:
         f"backend = \"{cfg.engine.backend}\"\n"
         f"model = \"{cfg.engine.model}\"\n"
         f"language = \"{cfg.engine.language}\"\n"
-        f"word_timestamps = {str(cfg.engine.word_timestamps).lower()}\n\n"
+        f"word_timestamps = {str(cfg.engine.word_timestamps).lower()}\n"
+        f"quant = \"{cfg.engine.quant}\"\n"
+        f"coreml = {str(cfg.engine.coreml).lower()}\n\n"
         "[vad]\n"
         f"aggressiveness = {cfg.vad.aggressiveness}\n"
         f"frame_ms = {cfg.vad.frame_ms}\n"
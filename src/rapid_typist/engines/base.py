@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Optional, Protocol
 import numpy as np
 
 
 class Transcriber(Protocol):
-    def transcribe(self, pcm: np.ndarray) -> str:  # returns final text
+    def transcribe(self, pcm: np.ndarray, prompt: Optional[str] = None) -> str:  # returns final text
         ...
@@ -1,13 +1,84 @@
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+from typing import Optional
+
 import numpy as np
 
 from .base import Transcriber
 from ..audio.utils import int16_to_float32
 
+_GGML_BASE_URL = "https://huggingface.co/ggerganov/whisper.cpp/resolve/main"
+_DOWNLOAD_TIMEOUT_S = 30.0
+# whisper.cpp system_info() string, queried once per process
+_SYSTEM_INFO_CACHE: Optional[str] = None
+
+
+def resolve_model_name(model_name: str, quant: str = "f16") -> str:
+    """Map a model + quantization to a pywhispercpp model name (e.g. base.en-q5_1).
+    Falls back to the f16 weights when that quantization is not published for the model.
+    """
+    if quant == "f16":
+        return model_name
+    name = f"{model_name}-{quant}"
+    try:
+        from pywhispercpp.constants import AVAILABLE_MODELS  # type: ignore
+    except Exception:
+        return name
+    if name in AVAILABLE_MODELS:
+        return name
+    print(f"[rapid-typist] no {quant} weights for '{model_name}'; using f16")
+    return model_name
+
+
+def ensure_coreml_encoder(model_name: str) -> None:
+    """Download ggml-<model>-encoder.mlmodelc next to the ggml weights (macOS only).
+    whisper.cpp loads it automatically when built with CoreML; quantized weights share the f16 encoder.
+    """
+    if sys.platform != "darwin":
+        return
+    try:
+        from pywhispercpp.constants import MODELS_DIR  # type: ignore
+    except Exception:
+        return
+    name = f"ggml-{model_name}-encoder.mlmodelc"
+    target = Path(MODELS_DIR) / name
+    if target.exists():
+        return
+    import os
+    import shutil
+    import tempfile
+    import urllib.request
+    import zipfile
+
+    print(f"[rapid-typist] downloading CoreML encoder {name}…")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # stage next to the target so the final rename is atomic; a failed fetch leaves nothing behind
+        with tempfile.TemporaryDirectory(dir=target.parent) as tmp:
+            archive = Path(tmp) / f"{name}.zip"
+            with urllib.request.urlopen(f"{_GGML_BASE_URL}/{name}.zip", timeout=_DOWNLOAD_TIMEOUT_S) as resp:
+                with archive.open("wb") as fh:
+                    shutil.copyfileobj(resp, fh)
+            staged = Path(tmp) / "extract"
+            with zipfile.ZipFile(archive) as zf:
+                zf.extractall(staged)
+            if not (staged / name).is_dir():
+                raise RuntimeError(f"archive has no {name}")
+            os.replace(staged / name, target)
+    except Exception as e:
+        print(f"[rapid-typist] CoreML encoder unavailable ({e}); using Metal/CPU encoder")
+
 
 class WhisperCppTranscriber(Transcriber):
-    def __init__(self, model_name: str = "base.en", language: str = "en") -> None:
+    def __init__(
+        self,
+        model_name: str = "base.en",
+        language: str = "en",
+        quant: str = "f16",
+        coreml: bool = False,
+    ) -> None:
         try:
             from pywhispercpp.model import Model  # type: ignore
         except Exception as e:  # pragma: no cover
@@ -16,18 +87,44 @@ class WhisperCppTranscriber(Transcriber):
             ) from e
         self.Model = Model
         self.language = language
+        if coreml:
+            ensure_coreml_encoder(model_name)
         # Load model; pywhispercpp caches under ~/Library/Application Support/pywhispercpp/models
-        self.model = self.Model(model_name)
+        self.model = self.Model(resolve_model_name(model_name, quant))
         # Emit info; pywhispercpp prints Metal/CoreML usage to stdout when initializing
+        global _SYSTEM_INFO_CACHE
         try:
-            info = self.model.system_info()
-            print(f"[rapid-typist] whisper.cpp ready — system_info: {info}")
+            if _SYSTEM_INFO_CACHE is None:
+                _SYSTEM_INFO_CACHE = self.model.system_info()
+            print(f"[rapid-typist] whisper.cpp ready — system_info: {_SYSTEM_INFO_CACHE}")
         except Exception:
             print(f"[rapid-typist] whisper.cpp ready (model={model_name})")
+        # Prompt carry-over lets partials decode only new audio; older bindings lack the param
+        try:
+            self.supports_prompt = "initial_prompt" in self.model.get_params()
+        except Exception:
+            self.supports_prompt = False
+        self._prompted = False
+        # Grow-only float32 scratch for int16 input; avoids a fresh array per transcribe
+        self._scratch = np.empty(0, dtype=np.float32)
+
+    def _as_float32(self, pcm: np.ndarray) -> np.ndarray:
+        # float32 input is taken as already-normalized audio (e.g. the partials window)
+        if pcm.dtype == np.float32:
+            return pcm
+        n = pcm.shape[0]
+        if n > self._scratch.shape[0]:
+            self._scratch = np.empty(n, dtype=np.float32)
+        return int16_to_float32(pcm, out=self._scratch[:n])
 
-    def transcribe(self, pcm: np.ndarray) -> str:
-        audio = int16_to_float32(pcm)
-        segs = self.model.transcribe(audio, language=self.language)
+    def transcribe(self, pcm: np.ndarray, prompt: Optional[str] = None) -> str:
+        audio = self._as_float32(pcm)
+        params = {"language": self.language}
+        # pywhispercpp keeps params between calls, so reset a previous prompt explicitly
+        if self.supports_prompt and (prompt or self._prompted):
+            params["initial_prompt"] = prompt or ""
+            self._prompted = bool(prompt)
+        segs = self.model.transcribe(audio, **params)
         try:
             return " ".join(getattr(s, "text", str(s)) for s in segs).strip()
         except Exception:
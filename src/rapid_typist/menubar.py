@@ -2,15 +2,15 @@ from __future__ import annotations
 
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import threading
 import time
 from typing import Optional
 
 import rumps
-import sounddevice as sd
 
-from .cli import Pipeline
+from .cli import Pipeline, build_sink
 from .config import load_config, save_config
 from .tui import NoopTUI
 from .hotkey import create_hotkey_listener
@@ -26,6 +26,41 @@ MODEL_CHOICES = [
     "large-v3",
 ]
 
+# (timestamp, devices) from the last sd.query_devices(); CoreAudio enumeration is slow on the UI thread
+_DEVICE_CACHE: tuple[float, list] = (0.0, [])
+
+
+def _cached_query_devices(ttl: float = 10.0) -> list:
+    global _DEVICE_CACHE
+    ts, devs = _DEVICE_CACHE
+    now = time.monotonic()
+    if devs and now - ts < ttl:
+        return devs
+    import sounddevice as sd
+
+    devs = list(sd.query_devices())
+    _DEVICE_CACHE = (now, devs)
+    return devs
+
+
+def _invalidate_device_cache() -> None:
+    global _DEVICE_CACHE
+    _DEVICE_CACHE = (0.0, [])
+
+
+def _open(target: str, is_file: bool = False) -> None:
+    # Hand the URL to Launch Services in-process (NSWorkspace) instead of forking /usr/bin/open
+    try:
+        from AppKit import NSWorkspace  # type: ignore
+        from Foundation import NSURL  # type: ignore
+
+        url = NSURL.fileURLWithPath_(target) if is_file else NSURL.URLWithString_(target)
+        if url is not None and NSWorkspace.sharedWorkspace().openURL_(url):
+            return
+    except Exception:
+        pass
+    subprocess.run(["open", target])
+
 
 class MenuBarApp(rumps.App):
     def __init__(self):
@@ -34,6 +69,14 @@ class MenuBarApp(rumps.App):
         self.cfg = load_config()
         self.pipeline = Pipeline(cfg=self.cfg, tui=NoopTUI(), device_name=self.cfg.app.input_device, enable_partials=False)
         self.listener = None
+        self._loading = False
+        # debounced config writes: one TOML write after a burst of menu changes, off the UI thread
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        # serializes the disk writes themselves; _save_lock only guards the debounce timer
+        self._write_lock = threading.Lock()
+        # pipeline actions (toggle, model load, restart) run here, off the UI and hotkey threads, one at a time
+        self._action_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hotkey-action")
         # Startup diagnostics
         print(
             "[rapid-typist] menubar:",
@@ -73,21 +116,26 @@ class MenuBarApp(rumps.App):
             self.mi_quit,
         ]
 
-        # Populate submenus
+        # Populate submenus; _checked holds the checked item name per submenu
+        self._checked: dict[str, Optional[str]] = {"sink": None, "model": None, "device": None, "vad": None}
         self._build_sink_menu()
         self._build_model_menu()
         self._build_device_menu()
         self._build_vad_menu()
+        # check marks only change with settings, so they are synced on change, not per tick
+        self._sync_checks()
+        self._last_title = self.title
+        self._last_status_text = self.mi_status.title
 
         # Start hotkey listener (double Fn by default)
         try:
-            self.listener = create_hotkey_listener(self.cfg.app.hotkey, self.pipeline.toggle)
+            self.listener = create_hotkey_listener(self.cfg.app.hotkey, self._submit_toggle)
             self.listener.start()
             print(f"[rapid-typist] hotkey listener started for '{self.cfg.app.hotkey}' (double-press if fn)")
         except Exception as e:
             print(f"[rapid-typist] hotkey init failed: {e}; falling back to right_option double-press")
             try:
-                self.listener = create_hotkey_listener("right_option", self.pipeline.toggle)
+                self.listener = create_hotkey_listener("right_option", self._submit_toggle)
                 self.listener.start()
                 self.mi_hotkey.title = "Hotkey: right_option (fallback)"
             except Exception:
@@ -97,33 +145,44 @@ class MenuBarApp(rumps.App):
         self._timer = rumps.Timer(self._tick, 0.5)
         self._timer.start()
 
+        # Load the model in the background so the menubar appears immediately
+        self._submit(self._preload)
+
+    def _submit(self, fn) -> None:
+        # futures are never awaited, so report failures here instead of losing them
+        def run():
+            try:
+                fn()
+            except Exception as e:
+                print(f"[rapid-typist] action failed: {e}")
+        self._action_exec.submit(run)
+
     def _tick(self, _):
         if getattr(self.pipeline, "_active", False):
-            self.title = "● rapid-typist"
-            self.mi_toggle.title = "Stop Recording"
+            title, toggle = "● rapid-typist", "Stop Recording"
             # update status with partials or last final
             try:
                 st = self.pipeline.tui.state
-                if st.partial_text:
-                    txt = st.partial_text
-                    if len(txt) > 40:
-                        txt = txt[:37] + "..."
-                    self.mi_status.title = f"Partial: {txt}"
-                elif st.last_text:
-                    txt = st.last_text
-                    if len(txt) > 40:
-                        txt = txt[:37] + "..."
-                    self.mi_status.title = f"Last: {txt}"
+                if st.partial_preview:
+                    status = f"Partial: {st.partial_preview}"
+                elif st.last_preview:
+                    status = f"Last: {st.last_preview}"
                 else:
-                    self.mi_status.title = "Status: Listening…"
+                    status = "Status: Listening…"
             except Exception:
-                self.mi_status.title = "Status: Listening…"
+                status = "Status: Listening…"
         else:
-            self.title = "○ rapid-typist"
-            self.mi_toggle.title = "Start Recording"
-            self.mi_status.title = "Status: Idle"
-        # update sink/model/device checks
-        self._sync_checks()
+            title, toggle, status = "○ rapid-typist", "Start Recording", "Status: Idle"
+        if self._loading:
+            status = "Status: Loading model…"
+        # only cross the AppKit bridge when a string actually changed
+        if title != self._last_title:
+            self.title = title
+            self.mi_toggle.title = toggle
+            self._last_title = title
+        if status != self._last_status_text:
+            self.mi_status.title = status
+            self._last_status_text = status
 
     # Menu builders
     def _build_sink_menu(self):
@@ -153,6 +212,8 @@ class MenuBarApp(rumps.App):
             self.mi_device.clear()
         except Exception:
             pass
+        # rebuilt items start unchecked
+        self._checked["device"] = None
 
         def make_device_item(name: str):
             return rumps.MenuItem(name, callback=lambda _: self._set_device(name))
@@ -160,13 +221,18 @@ class MenuBarApp(rumps.App):
         # default option
         self.mi_device.add(make_device_item("default"))
         try:
-            devs = sd.query_devices()
+            devs = _cached_query_devices()
             for d in devs:
                 if int(d.get("max_input_channels", 0)) > 0:
                     self.mi_device.add(make_device_item(d["name"]))
         except Exception:
             pass
-        self.mi_device.add(rumps.MenuItem("Refresh", callback=lambda _: self._build_device_menu()))
+        self.mi_device.add(rumps.MenuItem("Refresh", callback=lambda _: self._refresh_devices()))
+
+    def _refresh_devices(self):
+        _invalidate_device_cache()
+        self._build_device_menu()
+        self._sync_checks()
 
     def _build_vad_menu(self):
         try:
@@ -177,67 +243,110 @@ class MenuBarApp(rumps.App):
             self.mi_vad.add(rumps.MenuItem(str(val), callback=lambda _, v=val: self._set_vad(v)))
 
     def _sync_checks(self):
-        # sink
-        for name, item in self.mi_sink.items():
-            if isinstance(item, rumps.MenuItem):
-                item.state = int(name == self.cfg.output.sink)
-        # model
-        for name, item in self.mi_model.items():
-            if isinstance(item, rumps.MenuItem):
-                item.state = int(name == self.cfg.engine.model)
-        # device
-        for name, item in self.mi_device.items():
-            if isinstance(item, rumps.MenuItem) and name not in ("Refresh",):
-                item.state = int(name == (self.cfg.app.input_device or "default"))
-        # vad
-        for name, item in self.mi_vad.items():
-            if isinstance(item, rumps.MenuItem):
-                try:
-                    item.state = int(int(name) == self.cfg.vad.aggressiveness)
-                except Exception:
-                    item.state = 0
+        self._check("sink", self.mi_sink, self.cfg.output.sink)
+        self._check("model", self.mi_model, self.cfg.engine.model)
+        self._check("device", self.mi_device, self.cfg.app.input_device or "default")
+        self._check("vad", self.mi_vad, str(self.cfg.vad.aggressiveness))
+
+    def _check(self, key: str, menu: rumps.MenuItem, name: str) -> None:
+        # touch only the previously checked item and the new one, not the whole submenu
+        prev = self._checked.get(key)
+        if prev == name:
+            return
+        for item_name, state in ((prev, 0), (name, 1)):
+            if item_name is None:
+                continue
+            try:
+                menu[item_name].state = state
+            except KeyError:
+                pass
+        self._checked[key] = name
 
     # Actions
     def _on_toggle(self, _):
-        self.pipeline.toggle()
+        self._submit_toggle()
+
+    def _submit_toggle(self):
+        self._submit(self.pipeline.toggle)
+
+    def _preload(self):
+        self._loading = True
+        try:
+            self.pipeline.preload()
+        except Exception as e:
+            print(f"[rapid-typist] model load failed: {e}")
+        finally:
+            self._loading = False
 
     def _restart_pipeline(self):
+        self._submit(self._restart_pipeline_bg)
+
+    def _restart_pipeline_bg(self):
         was_active = getattr(self.pipeline, "_active", False)
         if was_active:
             self.pipeline.stop()
             time.sleep(0.2)
-        # Create new pipeline with updated cfg
-        self.pipeline = Pipeline(cfg=self.cfg, tui=NoopTUI(), device_name=self.cfg.app.input_device, enable_partials=False)
+        # Same pipeline with updated cfg; preload() reloads the model only if engine settings changed
+        self.pipeline.device_name = self.cfg.app.input_device
+        self._preload()
         if was_active:
             self.pipeline.start()
 
     def _set_sink(self, name: str):
         self.cfg.output.sink = name  # type: ignore
-        save_config(self.cfg)
-        self._restart_pipeline()
+        self._schedule_save()
+        self._sync_checks()
+        # sinks are cheap to build; a stopped pipeline picks the new one up on start()
+        if getattr(self.pipeline, "_active", False):
+            self.pipeline.set_sink(build_sink(self.cfg))
 
     def _set_model(self, name: str):
         self.cfg.engine.model = name
-        save_config(self.cfg)
+        self._schedule_save()
+        self._sync_checks()
         self._restart_pipeline()
 
     def _set_device(self, name: str):
         self.cfg.app.input_device = name
-        save_config(self.cfg)
+        self._schedule_save()
+        self._sync_checks()
         self._restart_pipeline()
 
     def _set_vad(self, val: int):
-        self.cfg.vad.aggressiveness = int(val)
-        save_config(self.cfg)
-        self._restart_pipeline()
+        self.pipeline.set_vad_aggressiveness(val)
+        self._schedule_save()
+        self._sync_checks()
+
+    def _schedule_save(self, delay: float = 0.5):
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(delay, self._flush_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush_save(self):
+        # write taken before the timer is released, so _quit waits for an in-flight save
+        # and an older snapshot can never land after a newer one
+        with self._write_lock:
+            with self._save_lock:
+                if self._save_timer is None:
+                    return
+                self._save_timer.cancel()
+                self._save_timer = None
+                snapshot = self.cfg.model_copy(deep=True)
+            try:
+                save_config(snapshot)
+            except Exception as e:
+                print(f"[rapid-typist] config save failed: {e}")
 
     def _open_config(self, _):
         cfgp = os.path.expanduser("~/.rapid_typist.toml")
-        subprocess.run(["open", cfgp])
+        _open(cfgp, is_file=True)
 
     def _open_accessibility(self, _):
         # Open Accessibility settings panel
-        subprocess.run(["open", "x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility"])  # noqa: E501
+        _open("x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility")
 
     def _quit(self, _):
         try:
@@ -245,6 +354,9 @@ class MenuBarApp(rumps.App):
                 self.listener.stop()
         except Exception:
             pass
+        self._flush_save()
+        # don't block the UI behind a queued restart or model load; stop the pipeline directly
+        self._action_exec.shutdown(wait=False, cancel_futures=True)
         try:
             if getattr(self.pipeline, "_active", False):
                 self.pipeline.stop()
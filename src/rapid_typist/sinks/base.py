@@ -7,3 +7,5 @@ class Sink(Protocol):
     def handle_final(self, text: str) -> None:
         ...
 
+    def close(self) -> None:
+        """Release any held resources; the default sink holds none."""
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
+from typing import Optional, TextIO
+
 from .base import Sink
 
 
@@ -10,9 +13,20 @@ class FileSink(Sink):
         self.dir.mkdir(parents=True, exist_ok=True)
         self.separator = separator
         self.file = self.dir / "rapid-typist.txt"
+        # One append handle for the sink's lifetime; line-buffered so the file stays tailable
+        self._fh: Optional[TextIO] = None
+        self._lock = threading.Lock()
 
     def handle_final(self, text: str) -> None:
-        with self.file.open("a", encoding="utf-8") as f:
-            f.write(text)
-            f.write(self.separator)
+        with self._lock:
+            if self._fh is None:
+                self._fh = self.file.open("a", encoding="utf-8", buffering=1)
+            self._fh.write(text)
+            self._fh.write(self.separator)
+            self._fh.flush()
 
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import subprocess
+from typing import Any, Optional
+
+# kVK_ANSI_V is a physical key position (QWERTY "v"); on Dvorak/AZERTY etc. that key types
+# something else, so the keycode for "v" is looked up in the current layout before use.
+_KVK_ANSI_V = 9
+_CARBON = "/System/Library/Frameworks/Carbon.framework/Carbon"
+_CF = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+_K_UC_KEY_ACTION_DISPLAY = 3
+_K_UC_KEY_TRANSLATE_NO_DEAD_KEYS = 1
+_CMD_KEY_STATE = 0x100 >> 8  # cmdKey, as UCKeyTranslate wants it ("Dvorak - QWERTY ⌘" remaps under Cmd)
+
+# ctypes handles once loaded; False if Carbon is unavailable
+_tis: Any = None
+# layout data pointer -> keycode that types "v" under Cmd (None if the layout has no such key)
+_v_keycodes: dict[int, Optional[int]] = {}
+
+# (NSPasteboard, NSPasteboardTypeString) once resolved; False if AppKit is unavailable
+_pasteboard: Any = None
+
+
+def _general_pasteboard() -> Optional[tuple]:
+    global _pasteboard
+    if _pasteboard is None:
+        try:
+            from AppKit import NSPasteboard, NSPasteboardTypeString  # type: ignore
+
+            _pasteboard = (NSPasteboard.generalPasteboard(), NSPasteboardTypeString)
+        except Exception:
+            _pasteboard = False
+    return _pasteboard or None
+
+
+def _pbcopy(text: str) -> None:
+    p = subprocess.Popen(["/usr/bin/pbcopy"], stdin=subprocess.PIPE)
+    if p.stdin:
+        p.stdin.write(text.encode("utf-8"))
+        p.stdin.close()
+    p.wait(timeout=2)
+
+
+def copy_text(text: str) -> None:
+    """Put text on the general pasteboard in-process, falling back to pbcopy."""
+    pb = _general_pasteboard()
+    if pb is not None:
+        board, kind = pb
+        board.clearContents()
+        if board.setString_forType_(text, kind):
+            return
+    _pbcopy(text)
+
+
+def _load_tis() -> Optional[tuple]:
+    global _tis
+    if _tis is None:
+        try:
+            import ctypes
+
+            carbon = ctypes.CDLL(_CARBON)
+            cf = ctypes.CDLL(_CF)
+            carbon.TISCopyCurrentKeyboardLayoutInputSource.restype = ctypes.c_void_p
+            carbon.TISGetInputSourceProperty.restype = ctypes.c_void_p
+            carbon.TISGetInputSourceProperty.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+            carbon.LMGetKbdType.restype = ctypes.c_uint8
+            carbon.UCKeyTranslate.restype = ctypes.c_int32
+            carbon.UCKeyTranslate.argtypes = [
+                ctypes.c_void_p, ctypes.c_uint16, ctypes.c_uint16, ctypes.c_uint32, ctypes.c_uint32,
+                ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32), ctypes.c_ulong,
+                ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_uint16),
+            ]
+            cf.CFDataGetBytePtr.restype = ctypes.c_void_p
+            cf.CFDataGetBytePtr.argtypes = [ctypes.c_void_p]
+            cf.CFRelease.argtypes = [ctypes.c_void_p]
+            key = ctypes.c_void_p.in_dll(carbon, "kTISPropertyUnicodeKeyLayoutData")
+            _tis = (ctypes, carbon, cf, key)
+        except Exception:
+            _tis = False
+    return _tis or None
+
+
+def _layout_v_keycode() -> Optional[int]:
+    """Keycode that types "v" under Cmd in the current keyboard layout, or None if unknown."""
+    tis = _load_tis()
+    if tis is None:
+        return None
+    ctypes, carbon, cf, key = tis
+    src = carbon.TISCopyCurrentKeyboardLayoutInputSource()
+    if not src:
+        return None
+    try:
+        data = carbon.TISGetInputSourceProperty(src, key)
+        layout = cf.CFDataGetBytePtr(data) if data else None
+        if not layout:
+            return None
+        if layout not in _v_keycodes:
+            kbd = carbon.LMGetKbdType()
+            dead = ctypes.c_uint32(0)
+            n = ctypes.c_ulong(0)
+            buf = (ctypes.c_uint16 * 4)()
+            found = None
+            # QWERTY-family layouts hit on the first probe
+            for code in (_KVK_ANSI_V, *range(128)):
+                err = carbon.UCKeyTranslate(
+                    layout, code, _K_UC_KEY_ACTION_DISPLAY, _CMD_KEY_STATE, kbd,
+                    _K_UC_KEY_TRANSLATE_NO_DEAD_KEYS, ctypes.byref(dead), 4, ctypes.byref(n), buf,
+                )
+                if err == 0 and n.value == 1 and buf[0] in (ord("v"), ord("V")):
+                    found = code
+                    break
+            _v_keycodes[layout] = found
+        return _v_keycodes[layout]
+    finally:
+        cf.CFRelease(src)
+
+
+def press_cmd_v() -> None:
+    """Post Cmd+V to the frontmost app via a Quartz CGEvent, falling back to osascript.
+
+    The keycode comes from the current keyboard layout. If it can't be resolved (no Carbon,
+    or a layout without a "v" key), osascript's keystroke does the lookup instead.
+    """
+    try:
+        import Quartz  # type: ignore
+
+        code = _layout_v_keycode()
+        if code is None:
+            raise LookupError("no keycode for 'v' in the current layout")
+        for down in (True, False):
+            ev = Quartz.CGEventCreateKeyboardEvent(None, code, down)
+            Quartz.CGEventSetFlags(ev, Quartz.kCGEventFlagMaskCommand)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, ev)
+        return
+    except Exception:
+        pass
+    osa = 'tell application "System Events" to keystroke "v" using command down'
+    subprocess.run(["/usr/bin/osascript", "-e", osa], check=False)
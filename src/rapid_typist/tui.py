@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.table import Table
+if TYPE_CHECKING:  # rich is imported lazily so NoopTUI users never load it
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.text import Text
 
 
 @dataclass
@@ -22,15 +22,42 @@ class TUIState:
     partial_text: str = ""
     last_text: str = ""
     last_latency_ms: Optional[int] = None
+    # menubar-length forms of partial_text/last_text, recomputed only when those change
+    partial_preview: str = ""
+    last_preview: str = ""
+
+
+_PREVIEW_CHARS = 40
+
+
+def _preview(text: str) -> str:
+    return text if len(text) <= _PREVIEW_CHARS else text[: _PREVIEW_CHARS - 3] + "..."
+
+
+def _apply(state: TUIState, kwargs: dict) -> None:
+    for k, v in kwargs.items():
+        if hasattr(state, k):
+            setattr(state, k, v)
+    if "partial_text" in kwargs:
+        state.partial_preview = _preview(state.partial_text)
+    if "last_text" in kwargs:
+        state.last_preview = _preview(state.last_text)
 
 
 class TUI:
     def __init__(self) -> None:
+        from rich.console import Console
+
         self.console = Console()
         self.state = TUIState()
         self._live: Optional[Live] = None
+        # header markup is parsed only when model/sink/device/hotkey change
+        self._header: Optional[Text] = None
+        self._header_key: Optional[tuple] = None
 
     def start(self) -> None:
+        from rich.live import Live
+
         self._live = Live(self._render(), console=self.console, refresh_per_second=8)
         self._live.start()
 
@@ -40,17 +67,24 @@ class TUI:
             self._live = None
 
     def update(self, **kwargs) -> None:
-        for k, v in kwargs.items():
-            if hasattr(self.state, k):
-                setattr(self.state, k, v)
+        _apply(self.state, kwargs)
         if self._live:
             self._live.update(self._render())
 
     def _render(self) -> Panel:
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
+
+        st = self.state
+        key = (st.model, st.sink, st.device, st.hotkey)
+        if self._header is None or key != self._header_key:
+            self._header = Text.from_markup(
+                f"[bold]rapid-typist[/] — model=[cyan]{st.model}[/] sink=[magenta]{st.sink}[/] device=[green]{st.device}[/] hotkey=[blue]{st.hotkey}[/]"
+            )
+            self._header_key = key
         t = Table.grid(expand=True)
-        t.add_row(
-            f"[bold]rapid-typist[/] — model=[cyan]{self.state.model}[/] sink=[magenta]{self.state.sink}[/] device=[green]{self.state.device}[/] hotkey=[blue]{self.state.hotkey}[/]"
-        )
+        t.add_row(self._header)
         rec = "[green]● recording[/]" if self.state.recording else "[red]○ idle[/]"
         vad = "[yellow]speech[/]" if self.state.vad_active else "silence"
         level = f"{self.state.level_db:6.1f} dB"
@@ -77,6 +111,4 @@ class NoopTUI:
 
     def update(self, **kwargs) -> None:
         # Update internal state only; no rendering
-        for k, v in kwargs.items():
-            if hasattr(self.state, k):
-                setattr(self.state, k, v)
+        _apply(self.state, kwargs)
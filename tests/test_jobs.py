@@ -0,0 +1,67 @@
+from queue import Empty
+
+import numpy as np
+import pytest
+
+from rapid_typist.cli import _FINAL, _PARTIAL, InferenceJobs
+
+
+def _seg(v, n=2):
+    return np.full(n, v, dtype=np.float32)
+
+
+def test_finals_before_partials_and_batched_in_order():
+    jobs = InferenceJobs()
+    jobs.put_partial("p0")
+    jobs.put_final(_seg(1))
+    jobs.put_final(_seg(2))
+    kind, audio = jobs.get(timeout=0)
+    assert kind == _FINAL
+    assert audio.tolist() == [1, 1, 2, 2]
+    kind, (_, payload) = jobs.get(timeout=0)
+    assert (kind, payload) == (_PARTIAL, "p0")
+    with pytest.raises(Empty):
+        jobs.get(timeout=0)
+
+
+def test_partials_coalesce_to_newest():
+    jobs = InferenceJobs()
+    for p in ("p0", "p1", "p2"):
+        jobs.put_partial(p)
+    kind, (_, payload) = jobs.get(timeout=0)
+    assert (kind, payload) == (_PARTIAL, "p2")
+    with pytest.raises(Empty):
+        jobs.get(timeout=0)
+
+
+def test_partial_requeued_behind_final_that_arrives_while_coalescing():
+    jobs = InferenceJobs()
+    jobs.put_partial("p0")
+    take = jobs._q.get
+
+    def take_then_final(*args, **kwargs):
+        # the segmenter finalizes right after the inference thread takes the partial
+        jobs._q.get = take
+        job = take(*args, **kwargs)
+        jobs.put_final(_seg(5))
+        return job
+
+    jobs._q.get = take_then_final
+    kind, audio = jobs.get(timeout=0.1)
+    assert kind == _FINAL and audio.tolist() == [5, 5]
+    kind, (epoch, payload) = jobs.get(timeout=0)
+    assert (kind, payload) == (_PARTIAL, "p0")
+    assert jobs.is_stale(epoch)
+
+
+def test_final_makes_earlier_partials_stale():
+    jobs = InferenceJobs()
+    jobs.put_partial("p0")
+    _, (epoch, _) = jobs.get(timeout=0)
+    assert not jobs.is_stale(epoch)
+    jobs.put_final(_seg(1))
+    assert jobs.is_stale(epoch)
+    jobs.put_partial("p1")
+    jobs.get(timeout=0)
+    _, (epoch2, _) = jobs.get(timeout=0)
+    assert not jobs.is_stale(epoch2)
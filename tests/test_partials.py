@@ -0,0 +1,52 @@
+import numpy as np
+
+from rapid_typist.audio.ring import RollingBuffer
+from rapid_typist.cli import _merge_partial, _partial_window
+
+
+def _ring(n_written, size=100):
+    ring = RollingBuffer(size, frame_samples=10)
+    for start in range(0, n_written, 10):
+        ring.write(np.arange(start, start + 10, dtype=np.int16))
+    return ring
+
+
+def test_incremental_window_covers_new_audio_plus_lookbehind():
+    ring = _ring(80)
+    audio, prompt = _partial_window(ring, "hello", last_end=50, lookbehind=5, incremental=True)
+    assert prompt == "hello"
+    assert audio.tolist() == list(range(45, 80))
+
+
+def test_full_window_without_prompt_support_or_previous_text():
+    ring = _ring(80)
+    for prev, incremental in (("hello", False), ("", True)):
+        audio, prompt = _partial_window(ring, prev, last_end=50, lookbehind=5, incremental=incremental)
+        assert prompt is None
+        assert audio.tolist() == list(range(80))
+
+
+def test_full_window_when_span_left_the_ring_or_ring_was_reset():
+    ring = _ring(300)
+    # 300 - 150 + 5 samples needed, only the newest 100 are kept
+    audio, prompt = _partial_window(ring, "hello", last_end=150, lookbehind=5, incremental=True)
+    assert prompt is None and audio.tolist() == list(range(200, 300))
+    ring.clear()
+    ring.write(np.arange(10, dtype=np.int16))
+    audio, prompt = _partial_window(ring, "hello", last_end=150, lookbehind=5, incremental=True)
+    assert prompt is None and len(audio) == 10
+
+
+def test_merge_partial_drops_redecoded_lookbehind_words():
+    assert _merge_partial("we went to the", "the store today") == "we went to the store today"
+    assert _merge_partial("I said hello,", "Hello there") == "I said hello, there"
+    assert _merge_partial("one two", "three four") == "one two three four"
+
+
+def test_merge_partial_replaces_a_word_cut_at_the_boundary():
+    assert _merge_partial("speech recog", "recognition works") == "speech recognition works"
+
+
+def test_merge_partial_empty_sides():
+    assert _merge_partial("", "new text") == "new text"
+    assert _merge_partial("old text", "") == "old text"
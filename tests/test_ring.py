@@ -0,0 +1,93 @@
+import threading
+
+import numpy as np
+
+from rapid_typist.audio.ring import RollingBuffer
+from rapid_typist.audio.spsc import FrameRing
+
+
+def test_rolling_buffer_keeps_latest_samples_in_order():
+    ring = RollingBuffer(10)
+    assert len(ring) == 0
+    ring.write(np.arange(4, dtype=np.int16))
+    assert ring.snapshot().tolist() == [0, 1, 2, 3]
+    for start in range(4, 24, 4):
+        ring.write(np.arange(start, start + 4, dtype=np.int16))
+    assert len(ring) == 10
+    assert ring.snapshot().tolist() == list(range(14, 24))
+    ring.write(np.arange(100, 125, dtype=np.int16))
+    assert ring.snapshot().tolist() == list(range(115, 125))
+    assert ring.latest(3).tolist() == [122, 123, 124]
+    out = np.zeros(12, dtype=np.int16)
+    assert ring.read_into(out) == 10
+    assert out[:10].tolist() == list(range(115, 125))
+    assert ring.total == 49
+    ring.clear()
+    assert len(ring) == 0
+    assert ring.total == 0
+
+
+def test_frame_ring_preserves_order_and_drops_when_full():
+    ring = FrameRing(4, 3)
+    assert ring.get(timeout=0) is None
+    assert all(ring.put(np.full(3, i, dtype=np.int16)) for i in range(3))
+    assert not ring.put(np.full(3, 9, dtype=np.int16))
+    held = ring.get(timeout=0)
+    assert held.tolist() == [0, 0, 0]
+    assert ring.put(np.full(3, 3, dtype=np.int16))
+    assert not ring.put(np.full(3, 9, dtype=np.int16))
+    assert held.tolist() == [0, 0, 0]
+    assert [ring.get(timeout=0)[0] for _ in range(3)] == [1, 2, 3]
+    assert len(ring) == 0
+
+
+def test_frame_ring_across_threads():
+    ring = FrameRing(8, 2)
+    n = 2000
+
+    def produce():
+        i = 0
+        while i < n:
+            if ring.put(np.array([i, -i], dtype=np.int16)):
+                i += 1
+
+    t = threading.Thread(target=produce)
+    t.start()
+    got = []
+    while len(got) < n:
+        frame = ring.get(timeout=1.0)
+        assert frame is not None
+        got.append(int(frame[0]))
+    t.join()
+    assert got == list(range(n))
+
+
+def test_rolling_buffer_scales_into_float32():
+    ring = RollingBuffer(4, dtype=np.float32, scale=1.0 / 32768.0)
+    ring.write(np.array([-32768, 0, 16384], dtype=np.int16))
+    ring.write(np.array([32767, 8192], dtype=np.int16))
+    out = ring.snapshot()
+    assert out.dtype == np.float32
+    assert out.tolist() == [0.0, 0.5, 32767 / 32768.0, 0.25]
+
+
+def test_frame_ring_reuses_slot_views():
+    ring = FrameRing(3, 2)
+    stop = threading.Event()
+    seen = []
+    for i in range(4):
+        ring.put(np.array([i, i], dtype=np.int16))
+        frame = next(ring.frames(stop))
+        assert frame[0] == i
+        seen.append(id(frame))
+    assert seen[0] == seen[3]
+
+
+def test_rolling_buffer_frame_aligned_writes():
+    ring = RollingBuffer(10, frame_samples=4)
+    for start in range(0, 20, 4):
+        ring.write(np.arange(start, start + 4, dtype=np.int16))
+    assert len(ring) == 12
+    assert ring.snapshot().tolist() == list(range(8, 20))
+    ring.write(np.arange(20, 23, dtype=np.int16))
+    assert ring.snapshot().tolist() == list(range(11, 23))
@@ -0,0 +1,14 @@
+from rapid_typist.sinks.file import FileSink
+
+
+def test_file_sink_appends_across_close(tmp_path):
+    sink = FileSink(str(tmp_path), separator="\n")
+    sink.handle_final("one")
+    sink.handle_final("two")
+    # line-buffered and flushed: readable while the handle is still open
+    assert sink.file.read_text(encoding="utf-8") == "one\ntwo\n"
+    sink.close()
+    sink.close()
+    sink.handle_final("three")
+    sink.close()
+    assert sink.file.read_text(encoding="utf-8") == "one\ntwo\nthree\n"
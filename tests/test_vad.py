@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from rapid_typist.audio.vad import Segmenter
+
+
+class _EnergyVad:
+    """Deterministic stand-in for webrtcvad: any non-zero frame is speech."""
+
+    def is_speech(self, buf, sample_rate):
+        return any(bytes(buf))
+
+
+def _segmenter(**kwargs) -> Segmenter:
+    seg = Segmenter(**kwargs)
+    seg.vad = _EnergyVad()
+    return seg
+
+
+def _frames(pattern, n=480):
+    return [np.full(n, 1000 if p else 0, dtype=np.int16) for p in pattern]
+
+
+def test_segment_includes_preroll_and_hangover():
+    seg = _segmenter(hangover_ms=90, preroll_ms=60)
+    pattern = [0] * 10 + [1] * 20 + [0] * 10
+    out = list(seg.segments(iter(_frames(pattern))))
+    assert len(out) == 1
+    assert out[0].dtype == np.int16
+    assert out[0].size == (2 + 20 + 3) * 480
+
+
+def test_long_segment_is_split_at_max_length():
+    seg = _segmenter(hangover_ms=30, preroll_ms=0, max_segment_ms=300)
+    pattern = [1] * 25 + [0] * 5
+    out = list(seg.segments(iter(_frames(pattern))))
+    assert [s.size // 480 for s in out] == [10, 10, 6]
+
+
+def test_float_segments_are_normalized():
+    seg = _segmenter(hangover_ms=30, preroll_ms=0, float_segments=True)
+    out = list(seg.segments(iter(_frames([1] * 3 + [0] * 3))))
+    assert len(out) == 1
+    assert out[0].dtype == np.float32
+    assert out[0].size == 4 * 480
+    assert np.allclose(out[0][: 3 * 480], 1000 / 32768.0)
+
+
+def test_mismatched_frames_are_rejected():
+    seg = Segmenter()
+    with pytest.raises(ValueError):
+        list(seg.run(iter([np.zeros(320, dtype=np.int16)])))